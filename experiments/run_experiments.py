@@ -6,110 +6,210 @@ Generates random graphs, runs the solver, and logs per-trial results to CSV file
 
 import argparse
 import csv
+import hashlib
+import io
 import os
-import random
 import re
 import struct
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 
 WEIGHT_MIN = 0.1
 WEIGHT_MAX = 100.0
 
+# Matches the solver's binary edge record: [int32 u][int32 v][float64 w].
+EDGE_DTYPE = np.dtype([("u", "<i4"), ("v", "<i4"), ("w", "<f8")])
+
 
 def generate_connected_graph(n, m, seed=None):
     """Generate a random connected directed graph.
 
     Ensures connectivity by first creating a spanning tree, then adding
-    random edges until the target edge count is reached.
+    random edges until the target edge count is reached. All phases are
+    vectorized with NumPy so generation cost is a few C-level passes
+    rather than O(m) Python calls.
 
-    Returns list of (u, v, w) tuples.
+    Returns a structured ndarray with fields (u, v, w); see EDGE_DTYPE.
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     if m < n - 1:
         raise ValueError(f"Need at least {n-1} edges for {n} nodes to be connected")
-
-    edges = []
-    edge_set = set()
-
-    # Step 1: spanning tree for connectivity
-    nodes = list(range(n))
-    random.shuffle(nodes)
-    for i in range(1, n):
-        parent = random.randint(0, i - 1)
-        u, v = nodes[parent], nodes[i]
-        w = random.uniform(WEIGHT_MIN, WEIGHT_MAX)
-        edges.append((u, v, w))
-        edge_set.add((u, v))
-
-    # Step 2: remaining random edges
+    if m > n * (n - 1):
+        raise ValueError(f"At most {n*(n-1)} distinct edges exist for {n} nodes")
+
+    # Step 1: spanning tree for connectivity. Each node i > 0 gets a
+    # uniformly random parent among nodes [0, i); shuffled labels make the
+    # tree shape independent of node numbering.
+    nodes = rng.permutation(n)
+    parents = rng.integers(0, np.arange(1, n)) if n > 1 else np.empty(0, dtype=np.int64)
+    tree_u = nodes[parents]
+    tree_v = nodes[1:]
+
+    # Step 2: remaining random edges. Oversample candidate pairs, pack each
+    # (u, v) into a single uint64 key, and deduplicate with np.unique;
+    # repeat until enough unique non-tree, non-self-loop edges accumulate.
     remaining = m - (n - 1)
-    attempts = 0
-    max_attempts = remaining * 100
-    while len(edges) < m and attempts < max_attempts:
-        u = random.randint(0, n - 1)
-        v = random.randint(0, n - 1)
-        if u != v and (u, v) not in edge_set:
-            w = random.uniform(WEIGHT_MIN, WEIGHT_MAX)
-            edges.append((u, v, w))
-            edge_set.add((u, v))
-        attempts += 1
-
-    random.shuffle(edges)
+    seen = tree_u.astype(np.uint64) * np.uint64(n) + tree_v.astype(np.uint64)
+    extra = np.empty(0, dtype=np.uint64)
+    rounds = 0
+    max_rounds = 100
+    while extra.size < remaining and rounds < max_rounds:
+        batch = int((remaining - extra.size) * 1.3) + 16
+        u = rng.integers(0, n, size=batch, dtype=np.uint64)
+        v = rng.integers(0, n, size=batch, dtype=np.uint64)
+        keys = u * np.uint64(n) + v
+        keys = keys[u != v]
+        keys = np.unique(keys)
+        keys = keys[~np.isin(keys, seen, assume_unique=True)]
+        keys = keys[: remaining - extra.size]
+        extra = np.concatenate([extra, keys])
+        seen = np.concatenate([seen, keys])
+        rounds += 1
+
+    if extra.size < remaining:
+        # Near edge saturation rejection sampling stalls; enumerate the
+        # complement exactly and draw the shortfall from it. Only reached
+        # when m approaches n*(n-1), so the n*n key universe is of the
+        # same order as m.
+        all_keys = np.arange(n * n, dtype=np.uint64)
+        all_keys = all_keys[all_keys // np.uint64(n) != all_keys % np.uint64(n)]
+        free = all_keys[~np.isin(all_keys, seen, assume_unique=True)]
+        picked = rng.choice(free, size=remaining - extra.size, replace=False)
+        extra = np.concatenate([extra, picked])
+
+    total = (n - 1) + extra.size
+    edges = np.empty(total, dtype=EDGE_DTYPE)
+    edges["u"][: n - 1] = tree_u
+    edges["v"][: n - 1] = tree_v
+    edges["u"][n - 1 :] = extra // np.uint64(n)
+    edges["v"][n - 1 :] = extra % np.uint64(n)
+    edges["w"] = rng.uniform(WEIGHT_MIN, WEIGHT_MAX, size=total)
+
+    rng.shuffle(edges)
     return edges
 
 
-def write_graph_to_file(filepath, n, edges, source=0):
-    """Write graph in the solver's stdin format."""
-    with open(filepath, "w") as f:
-        f.write(f"{n} {len(edges)}\n")
-        for u, v, w in edges:
-            f.write(f"{u} {v} {w:.4f}\n")
-        f.write(f"{source}\n")
+def serialize_graph_text(n, edges, source=0):
+    """Serialize graph to bytes in the solver's text stdin format."""
+    buf = io.BytesIO()
+    buf.write(f"{n} {len(edges)}\n".encode())
+    np.savetxt(buf, edges, fmt="%d %d %.4f")
+    buf.write(f"{source}\n".encode())
+    return buf.getvalue()
 
 
-def write_graph_binary(filepath, n, edges, source=0):
-    """Write graph in binary format for fast solver I/O.
+def serialize_graph_binary(n, edges, source=0):
+    """Serialize graph to bytes in the solver's binary stdin format.
 
     Format: [int32 n][int32 m][int32 source] then m × [int32 u][int32 v][float64 w]
+
+    EDGE_DTYPE is laid out exactly like the solver's edge record, so the
+    edge block is a single ndarray.tobytes() copy with no per-edge packing.
     """
-    m = len(edges)
-    with open(filepath, "wb") as f:
-        f.write(struct.pack("<iii", n, m, source))
-        for u, v, w in edges:
-            f.write(struct.pack("<iid", u, v, w))
+    edges = np.ascontiguousarray(edges, dtype=EDGE_DTYPE)
+    return struct.pack("<iii", n, len(edges), source) + edges.tobytes()
+
+
+def prepare_graph_bytes(n, m, seed, cache_dir=None):
+    """Return the serialized binary graph for (n, m, seed).
+
+    Generation is deterministic on (n, m, seed), so when cache_dir is set
+    the serialized graph is memoized on disk under a blake2b key and
+    reruns skip graph construction entirely. Cache files are written
+    atomically (temp file + os.replace) so concurrent workers never see
+    partial graphs.
+    """
+    if cache_dir is None:
+        edges = generate_connected_graph(n, m, seed=seed)
+        return serialize_graph_binary(n, edges)
+
+    key = hashlib.blake2b(f"{n}-{m}-{seed}".encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.graph")
+    if os.path.isfile(cache_path):
+        with open(cache_path, "rb") as f:
+            return f.read()
+
+    edges = generate_connected_graph(n, m, seed=seed)
+    graph_bytes = serialize_graph_binary(n, edges)
+    with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tmp:
+        tmp.write(graph_bytes)
+    os.replace(tmp.name, cache_path)
+    return graph_bytes
+
+
+# Compiled timing patterns, keyed by solver label (compiled once per label
+# rather than on every extract_timing call).
+_TIMING_PATTERNS = {}
+
+
+def _timing_pattern(label):
+    pattern = _TIMING_PATTERNS.get(label)
+    if pattern is None:
+        pattern = _TIMING_PATTERNS.setdefault(
+            label, re.compile(rf"{re.escape(label)} Time:\s*([\d.]+)\s*ms")
+        )
+    return pattern
 
 
 def extract_timing(output, label="BMSSP"):
     """Extract timing in milliseconds from solver output."""
-    match = re.search(rf"{label} Time:\s*([\d.]+)\s*ms", output)
+    # In quiet mode the timing line is the only output, so the tail is
+    # enough; fall back to a full scan for verbose output.
+    pattern = _timing_pattern(label)
+    match = pattern.search(output[-512:]) or pattern.search(output)
     if match:
         return float(match.group(1))
     raise ValueError(f"Could not extract timing from output: {output[:200]}")
 
 
-def run_solver(solver_path, input_file, label="BMSSP", timeout=300, binary=False):
-    """Run the solver on an input file. Returns (time_ms, success)."""
+def extract_timings(output, count, label="BMSSP"):
+    """Extract per-graph timings from multi-graph (-m) solver output."""
+    times = [float(t) for t in _timing_pattern(label).findall(output)]
+    if len(times) != count:
+        raise ValueError(
+            f"Expected {count} timing lines, found {len(times)}: {output[:200]}"
+        )
+    return times
+
+
+def _parse_stderr_timings(stderr_bytes, count):
+    """Parse the bare per-graph timing lines newer solver binaries write
+    to stderr. Returns None when they are absent or garbled (older
+    binaries, stray warnings) so callers can fall back to stdout."""
+    try:
+        times = [float(line) for line in stderr_bytes.decode().split()]
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return times if len(times) == count else None
+
+
+def run_solver(solver_path, input_bytes, label="BMSSP", timeout=300, binary=False):
+    """Run the solver with the serialized graph piped to stdin.
+
+    Returns (time_ms, success).
+    """
     try:
         args = [solver_path, "-q"]
         if binary:
             args.append("-b")
-        mode = "rb" if binary else "r"
-        with open(input_file, mode) as f:
-            result = subprocess.run(
-                args,
-                stdin=f,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+        result = subprocess.run(
+            args,
+            input=input_bytes,
+            capture_output=True,
+            timeout=timeout,
+        )
         if result.returncode != 0:
             print(f"  Warning: Non-zero exit code: {result.returncode}")
             return 0.0, False
-        return extract_timing(result.stdout, label), True
+        times = _parse_stderr_timings(result.stderr, 1)
+        if times is not None:
+            return times[0], True
+        return extract_timing(result.stdout.decode(), label), True
     except subprocess.TimeoutExpired:
         print("  Warning: Solver timed out")
         return 0.0, False
@@ -118,13 +218,215 @@ def run_solver(solver_path, input_file, label="BMSSP", timeout=300, binary=False
         return 0.0, False
 
 
+def run_solver_batch(solver_path, graphs, label="BMSSP", timeout=300, binary=False):
+    """Run the solver once (-m) on a list of serialized graphs.
+
+    The process launch and solver initialization are paid once for the
+    whole batch instead of per graph. Returns a list of per-graph timings
+    in input order, or None if the invocation failed.
+    """
+    if binary:
+        payload = struct.pack("<i", len(graphs)) + b"".join(graphs)
+    else:
+        payload = f"{len(graphs)}\n".encode() + b"".join(graphs)
+    try:
+        args = [solver_path, "-q", "-m"]
+        if binary:
+            args.append("-b")
+        result = subprocess.run(
+            args,
+            input=payload,
+            capture_output=True,
+            timeout=timeout * len(graphs),
+        )
+        if result.returncode != 0:
+            print(f"  Warning: Non-zero exit code: {result.returncode}")
+            return None
+        times = _parse_stderr_timings(result.stderr, len(graphs))
+        if times is not None:
+            return times
+        return extract_timings(result.stdout.decode(), len(graphs), label)
+    except subprocess.TimeoutExpired:
+        print("  Warning: Solver timed out")
+        return None
+    except Exception as e:
+        print(f"  Error: {e}")
+        return None
+
+
 def make_seed(n, m, trial):
-    """Deterministic seed derived from experiment configuration."""
-    return hash((n, m, trial)) & 0x7FFFFFFF
+    """Deterministic seed derived from experiment configuration.
+
+    Mixes the configuration with fixed SplitMix64 multipliers instead of
+    Python's hash(), whose value for tuples is interpreter-defined and
+    subject to change; the same (n, m, trial) maps to the same seed on
+    any machine and Python version. This is the canonical seed scheme
+    for all experiments.
+    """
+    x = (
+        n * 0x9E3779B97F4A7C15
+        ^ m * 0xBF58476D1CE4E5B9
+        ^ trial * 0x94D049BB133111EB
+    )
+    return x & 0x7FFFFFFF
+
+
+def make_solvers(solver_path, dijkstra_path):
+    """Build the (name, path, output label) list of solvers to run."""
+    solvers = [("bmssp", solver_path, "BMSSP")]
+    if dijkstra_path:
+        solvers.append(("dijkstra", dijkstra_path, "Dijkstra"))
+    return solvers
+
+
+def _one_config(solvers, trial_jobs, cache_dir=None):
+    """Run every trial of one (n, m) configuration.
+
+    Each solver is invoked once with all its pending graphs concatenated
+    (-m protocol), so process launch cost is paid per configuration
+    rather than per trial. Top-level so it is picklable for
+    ProcessPoolExecutor workers.
+
+    trial_jobs is a list of (n, m, trial, seed, needed_solver_names).
+    Returns dict mapping trial -> list of (solver_name, time_ms or None).
+    """
+    graphs = [prepare_graph_bytes(n, m, seed, cache_dir) for n, m, _, seed, _ in trial_jobs]
+    results = {trial: [] for _, _, trial, _, _ in trial_jobs}
+    for solver_name, spath, label in solvers:
+        indices = [i for i, job in enumerate(trial_jobs) if solver_name in job[4]]
+        if not indices:
+            continue
+        timings = run_solver_batch(
+            spath, [graphs[i] for i in indices], label, binary=True
+        )
+        if timings is None:
+            timings = [None] * len(indices)
+        for i, timing in zip(indices, timings):
+            results[trial_jobs[i][2]].append((solver_name, timing))
+    return results
+
+
+def _record_trial(writer, spec, results):
+    """Write one trial's solver timings to CSV and the console."""
+    row_prefix, desc, _, _, _, _ = spec
+    rows = []
+    for solver_name, timing in results:
+        if timing is not None:
+            rows.append(row_prefix + [solver_name, f"{timing:.4f}"])
+            print(f"  {desc} [{solver_name}]: {timing:.2f} ms")
+        else:
+            print(f"  {desc} [{solver_name}]: FAILED")
+    writer.writerows(rows)
+
+
+def _record_config(writer, config_specs, results):
+    """Write all trials of one configuration's results."""
+    for spec, _ in config_specs:
+        _, _, _, _, trial, _ = spec
+        _record_trial(writer, spec, results.get(trial, []))
+
+
+def _completed_runs(csv_path, header):
+    """Read (n, m, trial, solver) keys already recorded in an existing CSV.
+
+    Returns None when there is no resumable file (missing, or the header
+    does not match the current schema).
+    """
+    if not os.path.isfile(csv_path):
+        return None
+    with open(csv_path, newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != header:
+            return None
+        completed = set()
+        for row in reader:
+            try:
+                key = (int(row["nodes"]), int(row["edges"]), int(row["trial"]), row["solver"])
+            except (TypeError, ValueError):
+                # A kill mid-write can leave a truncated final row; treat
+                # it as not done so the trial reruns.
+                continue
+            completed.add(key)
+        return completed
+
+
+def _ends_with_newline(path):
+    """Whether the file's last byte is a newline (empty counts as yes)."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def run_trials(csv_path, header, trial_specs, solvers, jobs, cache_dir=None):
+    """Run a list of trials and write results to a CSV file.
+
+    trial_specs is a list of (row_prefix, desc, n, m, trial, seed). With
+    jobs > 1 trials are fanned out across a process pool; CSV writes stay
+    serialized in the parent, so rows appear in completion order.
+
+    A compatible existing CSV is appended to rather than overwritten:
+    (n, m, trial, solver) runs already on disk are skipped, so an
+    interrupted sweep resumes where it left off.
+    """
+    completed = _completed_runs(csv_path, header)
+    skipped = 0
+    # Group pending trials by (n, m); each group becomes one task that
+    # invokes every solver once on its whole batch of graphs.
+    configs = {}
+    for spec in trial_specs:
+        _, _, n, m, trial, _ = spec
+        needed = [s[0] for s in solvers]
+        if completed is not None:
+            needed = [name for name in needed if (n, m, trial, name) not in completed]
+        if needed:
+            configs.setdefault((n, m), []).append((spec, needed))
+        else:
+            skipped += 1
+    if skipped:
+        print(f"Resuming: {skipped} completed trial(s) skipped")
+
+    mode = "a" if completed is not None else "w"
+    # Large buffer keeps each configuration's rows to a few buffered
+    # writes; the explicit flush lets partial results survive a kill.
+    with open(csv_path, mode, newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        if mode == "w":
+            writer.writerow(header)
+        elif not _ends_with_newline(csv_path):
+            # Terminate a truncated final row (kill mid-write) so new
+            # rows don't concatenate onto it.
+            f.write("\r\n")
+
+        def trial_jobs(config_specs):
+            return [
+                (n, m, trial, seed, needed)
+                for (_, _, n, m, trial, seed), needed in config_specs
+            ]
+
+        if jobs == 1:
+            for config_specs in configs.values():
+                results = _one_config(solvers, trial_jobs(config_specs), cache_dir)
+                _record_config(writer, config_specs, results)
+                f.flush()
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {
+                    pool.submit(_one_config, solvers, trial_jobs(config_specs), cache_dir):
+                        config_specs
+                    for config_specs in configs.values()
+                }
+                for future in as_completed(futures):
+                    _record_config(writer, futures[future], future.result())
+                    f.flush()
+
+    print(f"\nResults saved to {csv_path}")
 
 
 def run_node_scaling(solver_path, node_counts, edge_multiplier, trials, output_dir,
-                     dijkstra_path=None):
+                     dijkstra_path=None, jobs=1, cache_dir=None):
     """Run node-scaling experiment and write results to CSV."""
     csv_path = os.path.join(output_dir, "node_scaling.csv")
     print("=" * 60)
@@ -134,38 +436,30 @@ def run_node_scaling(solver_path, node_counts, edge_multiplier, trials, output_d
     print(f"Trials per configuration: {trials}")
     if dijkstra_path:
         print("Dijkstra baseline: enabled")
+    if jobs > 1:
+        print(f"Parallel jobs: {jobs}")
     print("=" * 60)
 
-    solvers = [("bmssp", solver_path, "BMSSP")]
-    if dijkstra_path:
-        solvers.append(("dijkstra", dijkstra_path, "Dijkstra"))
-
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["nodes", "edges", "trial", "seed", "solver", "time_ms"])
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            for n in node_counts:
-                m = edge_multiplier * n
-                print(f"\nn={n:,}, m={m:,}")
-                for trial in range(trials):
-                    seed = make_seed(n, m, trial)
-                    graph_file = os.path.join(tmpdir, "graph.bin")
-                    edges = generate_connected_graph(n, m, seed=seed)
-                    write_graph_binary(graph_file, n, edges)
-                    for solver_name, spath, label in solvers:
-                        timing, success = run_solver(spath, graph_file, label, binary=True)
-                        if success:
-                            writer.writerow([n, m, trial, seed, solver_name, f"{timing:.4f}"])
-                            print(f"  Trial {trial+1}/{trials} [{solver_name}]: {timing:.2f} ms")
-                        else:
-                            print(f"  Trial {trial+1}/{trials} [{solver_name}]: FAILED")
-
-    print(f"\nResults saved to {csv_path}")
+    trial_specs = []
+    for n in node_counts:
+        m = edge_multiplier * n
+        for trial in range(trials):
+            seed = make_seed(n, m, trial)
+            desc = f"n={n:,} m={m:,} trial {trial+1}/{trials}"
+            trial_specs.append(([n, m, trial, seed], desc, n, m, trial, seed))
+
+    run_trials(
+        csv_path,
+        ["nodes", "edges", "trial", "seed", "solver", "time_ms"],
+        trial_specs,
+        make_solvers(solver_path, dijkstra_path),
+        jobs,
+        cache_dir,
+    )
 
 
 def run_edge_density(solver_path, fixed_nodes, edge_multipliers, trials, output_dir,
-                     dijkstra_path=None):
+                     dijkstra_path=None, jobs=1, cache_dir=None):
     """Run edge-density experiment and write results to CSV."""
     csv_path = os.path.join(output_dir, "edge_density.csv")
     print("\n" + "=" * 60)
@@ -175,35 +469,44 @@ def run_edge_density(solver_path, fixed_nodes, edge_multipliers, trials, output_
     print(f"Trials per configuration: {trials}")
     if dijkstra_path:
         print("Dijkstra baseline: enabled")
+    if jobs > 1:
+        print(f"Parallel jobs: {jobs}")
     print("=" * 60)
 
-    solvers = [("bmssp", solver_path, "BMSSP")]
-    if dijkstra_path:
-        solvers.append(("dijkstra", dijkstra_path, "Dijkstra"))
+    n = fixed_nodes
+    trial_specs = []
+    for multiplier in edge_multipliers:
+        m = multiplier * n
+        for trial in range(trials):
+            seed = make_seed(n, m, trial)
+            desc = f"n={n:,} m={m:,} (x{multiplier}) trial {trial+1}/{trials}"
+            trial_specs.append(([n, m, multiplier, trial, seed], desc, n, m, trial, seed))
+
+    run_trials(
+        csv_path,
+        ["nodes", "edges", "multiplier", "trial", "seed", "solver", "time_ms"],
+        trial_specs,
+        make_solvers(solver_path, dijkstra_path),
+        jobs,
+        cache_dir,
+    )
 
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["nodes", "edges", "multiplier", "trial", "seed", "solver", "time_ms"])
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            for multiplier in edge_multipliers:
-                n = fixed_nodes
-                m = multiplier * n
-                print(f"\nn={n:,}, m={m:,} (multiplier={multiplier})")
-                for trial in range(trials):
-                    seed = make_seed(n, m, trial)
-                    graph_file = os.path.join(tmpdir, "graph.bin")
-                    edges = generate_connected_graph(n, m, seed=seed)
-                    write_graph_binary(graph_file, n, edges)
-                    for solver_name, spath, label in solvers:
-                        timing, success = run_solver(spath, graph_file, label, binary=True)
-                        if success:
-                            writer.writerow([n, m, multiplier, trial, seed, solver_name, f"{timing:.4f}"])
-                            print(f"  Trial {trial+1}/{trials} [{solver_name}]: {timing:.2f} ms")
-                        else:
-                            print(f"  Trial {trial+1}/{trials} [{solver_name}]: FAILED")
 
-    print(f"\nResults saved to {csv_path}")
+def pgo_warmup(solvers, cache_dir=None):
+    """Exercise each solver on one sparse and one dense graph.
+
+    Used to train binaries built with -DBMSSP_PGO=generate (see
+    CMakeLists.txt) on both graph-shape regimes before they are rebuilt
+    with -DBMSSP_PGO=use; timings from the warm-up are discarded.
+    """
+    print("PGO warm-up: running sparse and dense training graphs")
+    n = 20000
+    for multiplier in (4, 32):
+        m = multiplier * n
+        graph_bytes = prepare_graph_bytes(n, m, make_seed(n, m, 0), cache_dir)
+        for solver_name, spath, label in solvers:
+            run_solver(spath, graph_bytes, label, binary=True)
+            print(f"  n={n:,} m={m:,} [{solver_name}]: done")
 
 
 def parse_int_list(s):
@@ -275,9 +578,40 @@ def main():
         action="store_true",
         help="Skip the Dijkstra baseline comparison",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of parallel trial workers (default: CPU count)",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run trials serially for clean timing measurements (same as --jobs 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache serialized graphs here keyed by (n,m,seed) (default: disabled)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore --cache-dir and always regenerate graphs",
+    )
+    parser.add_argument(
+        "--pgo-warmup",
+        action="store_true",
+        help="Run sparse/dense training graphs first (for BMSSP_PGO=generate builds)",
+    )
 
     args = parser.parse_args()
 
+    jobs = 1 if args.serial else max(1, args.jobs)
+    cache_dir = None if args.no_cache else args.cache_dir
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
     solver_path = os.path.abspath(args.solver)
     if not os.path.isfile(solver_path):
         print(f"Error: Solver not found at {solver_path}", file=sys.stderr)
@@ -295,16 +629,19 @@ def main():
 
     os.makedirs(args.output_dir, exist_ok=True)
 
+    if args.pgo_warmup:
+        pgo_warmup(make_solvers(solver_path, dijkstra_path), cache_dir)
+
     if not args.skip_node_scaling:
         run_node_scaling(
             solver_path, args.node_counts, args.edge_multiplier, args.trials, args.output_dir,
-            dijkstra_path,
+            dijkstra_path, jobs, cache_dir,
         )
 
     if not args.skip_edge_density:
         run_edge_density(
             solver_path, args.fixed_nodes, args.edge_multipliers, args.trials, args.output_dir,
-            dijkstra_path,
+            dijkstra_path, jobs, cache_dir,
         )
 
     print("\nAll experiments complete.")
@@ -5,11 +5,16 @@ Reads CSV files produced by run_experiments.py and generates plots.
 """
 
 import argparse
-import csv
 import os
-import statistics
 import sys
 
+import matplotlib
+
+# Pick the backend before pyplot initializes one: headless runs never
+# show a window, and Agg skips GUI backend startup entirely.
+if "--no-show" in sys.argv:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -20,66 +25,67 @@ SOLVER_STYLES = {
 
 
 def read_csv(path):
-    """Read a CSV file and return list of dicts with numeric conversion."""
-    with open(path, newline="") as f:
-        reader = csv.DictReader(f)
-        rows = []
-        for row in reader:
-            converted = {}
-            for k, v in row.items():
-                try:
-                    converted[k] = int(v)
-                except ValueError:
-                    try:
-                        converted[k] = float(v)
-                    except ValueError:
-                        converted[k] = v
-            rows.append(converted)
-    return rows
-
-
-def aggregate(rows, group_key):
-    """Group rows by a key and compute stats on time_ms."""
-    groups = {}
-    for row in rows:
-        key = row[group_key]
-        groups.setdefault(key, []).append(row["time_ms"])
+    """Read a CSV file into columnar {column name -> ndarray} form.
+
+    Parsing and per-column type inference happen in one np.genfromtxt
+    pass, and keeping whole columns contiguous avoids materializing a
+    dict per row; aggregation works on array views.
+    """
+    # invalid_raise=False skips (with a warning) truncated rows that an
+    # interrupted experiment run can leave behind.
+    data = np.atleast_1d(
+        np.genfromtxt(path, delimiter=",", names=True, dtype=None,
+                      encoding="utf-8", invalid_raise=False)
+    )
+    return {name: data[name] for name in data.dtype.names}
+
+
+def num_rows(cols):
+    """Number of rows in a columnar CSV table."""
+    return len(next(iter(cols.values()))) if cols else 0
+
+
+def aggregate(cols, group_key):
+    """Group rows by a key column and compute stats on time_ms."""
+    keys = cols[group_key]
+    times = cols["time_ms"]
     result = []
-    for key in sorted(groups):
-        timings = groups[key]
+    for key in np.unique(keys):
+        timings = times[keys == key]
         result.append({
             group_key: key,
             "timings": timings,
-            "mean": statistics.mean(timings),
-            "std": statistics.stdev(timings) if len(timings) > 1 else 0,
-            "min": min(timings),
-            "max": max(timings),
+            "mean": timings.mean(),
+            "std": timings.std(ddof=1) if timings.size > 1 else 0.0,
+            "min": timings.min(),
+            "max": timings.max(),
         })
     return result
 
 
-def aggregate_by_solver(rows, group_key):
+def aggregate_by_solver(cols, group_key):
     """Split rows by solver, then aggregate each group.
 
     Returns dict[solver_name -> list[stats]].
-    Backward compatible: rows without a 'solver' column default to 'bmssp'.
+    Backward compatible: files without a 'solver' column are all 'bmssp'.
     """
+    if "solver" not in cols:
+        return {"bmssp": aggregate(cols, group_key)}
     by_solver = {}
-    for row in rows:
-        solver = row.get("solver", "bmssp")
-        by_solver.setdefault(solver, []).append(row)
-    return {solver: aggregate(solver_rows, group_key)
-            for solver, solver_rows in by_solver.items()}
+    for solver in np.unique(cols["solver"]):
+        mask = cols["solver"] == solver
+        sub = {name: col[mask] for name, col in cols.items()}
+        by_solver[str(solver)] = aggregate(sub, group_key)
+    return by_solver
 
 
-def plot_node_scaling(rows, output_dir, show):
+def plot_node_scaling(cols, output_dir, show):
     """Plot runtime vs. graph size (node scaling experiment)."""
-    solver_stats = aggregate_by_solver(rows, "nodes")
+    solver_stats = aggregate_by_solver(cols, "nodes")
     if not solver_stats:
         return
 
-    first = rows[0]
-    edge_mult = first["edges"] // first["nodes"]
+    edge_mult = int(cols["edges"][0] // cols["nodes"][0])
 
     fig, ax = plt.subplots(figsize=(10, 7))
 
@@ -123,13 +129,13 @@ def plot_node_scaling(rows, output_dir, show):
     plt.close(fig)
 
 
-def plot_edge_density(rows, output_dir, show):
+def plot_edge_density(cols, output_dir, show):
     """Plot runtime vs. edge multiplier (edge density experiment)."""
-    solver_stats = aggregate_by_solver(rows, "multiplier")
+    solver_stats = aggregate_by_solver(cols, "multiplier")
     if not solver_stats:
         return
 
-    fixed_nodes = rows[0]["nodes"]
+    fixed_nodes = int(cols["nodes"][0])
 
     fig, ax = plt.subplots(figsize=(10, 7))
 
@@ -181,15 +187,15 @@ def plot_edge_density(rows, output_dir, show):
     plt.close(fig)
 
 
-def plot_combined(node_rows, edge_rows, output_dir, show):
+def plot_combined(node_cols, edge_cols, output_dir, show):
     """Side-by-side combined analysis plot."""
-    node_solver_stats = aggregate_by_solver(node_rows, "nodes")
-    edge_solver_stats = aggregate_by_solver(edge_rows, "multiplier")
+    node_solver_stats = aggregate_by_solver(node_cols, "nodes")
+    edge_solver_stats = aggregate_by_solver(edge_cols, "multiplier")
     if not node_solver_stats or not edge_solver_stats:
         return
 
-    edge_mult = node_rows[0]["edges"] // node_rows[0]["nodes"]
-    fixed_nodes = edge_rows[0]["nodes"]
+    edge_mult = int(node_cols["edges"][0] // node_cols["nodes"][0])
+    fixed_nodes = int(edge_cols["nodes"][0])
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
@@ -279,25 +285,25 @@ def main():
     node_csv = os.path.join(args.results_dir, "node_scaling.csv")
     edge_csv = os.path.join(args.results_dir, "edge_density.csv")
 
-    node_rows = None
-    edge_rows = None
+    node_cols = None
+    edge_cols = None
 
     if os.path.isfile(node_csv):
-        node_rows = read_csv(node_csv)
-        print(f"Loaded {len(node_rows)} rows from {node_csv}")
-        plot_node_scaling(node_rows, args.output_dir, show)
+        node_cols = read_csv(node_csv)
+        print(f"Loaded {num_rows(node_cols)} rows from {node_csv}")
+        plot_node_scaling(node_cols, args.output_dir, show)
     else:
         print(f"Skipping node scaling plot ({node_csv} not found)")
 
     if os.path.isfile(edge_csv):
-        edge_rows = read_csv(edge_csv)
-        print(f"Loaded {len(edge_rows)} rows from {edge_csv}")
-        plot_edge_density(edge_rows, args.output_dir, show)
+        edge_cols = read_csv(edge_csv)
+        print(f"Loaded {num_rows(edge_cols)} rows from {edge_csv}")
+        plot_edge_density(edge_cols, args.output_dir, show)
     else:
         print(f"Skipping edge density plot ({edge_csv} not found)")
 
-    if node_rows and edge_rows:
-        plot_combined(node_rows, edge_rows, args.output_dir, show)
+    if node_cols and edge_cols:
+        plot_combined(node_cols, edge_cols, args.output_dir, show)
     else:
         print("Skipping combined plot (need both node_scaling.csv and edge_density.csv)")
 
@@ -15,67 +15,91 @@ int main(int argc, char* argv[]) {
 
     bool quiet = false;
     bool binary = false;
+    bool multi = false;
     for (int i = 1; i < argc; ++i) {
         if (strcmp(argv[i], "-q") == 0 || strcmp(argv[i], "--quiet") == 0)
             quiet = true;
         else if (strcmp(argv[i], "-b") == 0 || strcmp(argv[i], "--binary") == 0)
             binary = true;
+        else if (strcmp(argv[i], "-m") == 0 || strcmp(argv[i], "--multi") == 0)
+            multi = true;
     }
 
-    int n, m, source;
-    vector<vector<Edge>> adj;
+    // With -m, the input starts with a graph count and that many graphs
+    // follow back to back; one process launch is amortized over all of them.
+    int runs = 1;
+    if (multi) {
+        if (binary) {
+            int32_t count;
+            if (fread(&count, sizeof(int32_t), 1, stdin) != 1)
+                return 0;
+            runs = count;
+        } else {
+            if (!(cin >> runs))
+                return 0;
+        }
+    }
 
-    if (binary) {
-        int32_t header[3];
-        if (fread(header, sizeof(int32_t), 3, stdin) != 3)
-            return 0;
-        n = header[0];
-        m = header[1];
-        source = header[2];
-        adj.resize(n);
+    for (int run = 0; run < runs; ++run) {
+        int n, m, source;
+        vector<vector<Edge>> adj;
 
-        struct BinaryEdge {
-            int32_t u, v;
-            double w;
-        };
-        vector<BinaryEdge> edges(m);
-        if (fread(edges.data(), sizeof(BinaryEdge), m, stdin) != (size_t)m)
-            return 1;
-        for (int i = 0; i < m; ++i) {
-            if (edges[i].u < n && edges[i].v < n)
-                adj[edges[i].u].push_back({edges[i].v, edges[i].w});
-        }
-    } else {
-        if (!(cin >> n >> m))
-            return 0;
-        adj.resize(n);
-        for (int i = 0; i < m; ++i) {
-            int u, v;
-            double w;
-            cin >> u >> v >> w;
-            if (u < n && v < n)
-                adj[u].push_back({v, w});
+        if (binary) {
+            int32_t header[3];
+            if (fread(header, sizeof(int32_t), 3, stdin) != 3)
+                return 0;
+            n = header[0];
+            m = header[1];
+            source = header[2];
+            adj.resize(n);
+
+            struct BinaryEdge {
+                int32_t u, v;
+                double w;
+            };
+            vector<BinaryEdge> edges(m);
+            if (fread(edges.data(), sizeof(BinaryEdge), m, stdin) != (size_t)m)
+                return 1;
+            for (int i = 0; i < m; ++i) {
+                if (edges[i].u < n && edges[i].v < n)
+                    adj[edges[i].u].push_back({edges[i].v, edges[i].w});
+            }
+        } else {
+            if (!(cin >> n >> m))
+                return 0;
+            adj.resize(n);
+            for (int i = 0; i < m; ++i) {
+                int u, v;
+                double w;
+                cin >> u >> v >> w;
+                if (u < n && v < n)
+                    adj[u].push_back({v, w});
+            }
+            cin >> source;
         }
-        cin >> source;
-    }
 
-    auto start_time = chrono::high_resolution_clock::now();
-    vector<double> results = solve_sssp(n, adj, source);
-    auto end_time = chrono::high_resolution_clock::now();
+        auto start_time = chrono::high_resolution_clock::now();
+        vector<double> results = solve_sssp(n, adj, source);
+        auto end_time = chrono::high_resolution_clock::now();
 
-    auto duration =
-        chrono::duration_cast<chrono::microseconds>(end_time - start_time);
-    cout << "BMSSP Time: " << duration.count() / 1000.0 << " ms" << endl;
+        auto duration =
+            chrono::duration_cast<chrono::microseconds>(end_time - start_time);
+        double elapsed_ms = duration.count() / 1000.0;
+        cout << "BMSSP Time: " << elapsed_ms << " ms" << endl;
+        // Bare timing on stderr so harnesses can read it without
+        // scanning stdout (which may carry the full distance dump).
+        fprintf(stderr, "%.6f\n", elapsed_ms);
 
-    if (!quiet) {
-        cout << "--------------------" << endl;
-        for (int i = 0; i < n; ++i) {
-            cout << "Node " << i << ": ";
-            if (results[i] == numeric_limits<double>::infinity())
-                cout << "INF";
-            else
-                cout << results[i];
-            cout << endl;
+        if (!quiet) {
+            cout << "--------------------" << endl;
+            for (int i = 0; i < n; ++i) {
+                cout << "Node " << i << ": ";
+                if (results[i] == numeric_limits<double>::infinity())
+                    cout << "INF";
+                else
+                    cout << results[i];
+                cout << endl;
+            }
         }
     }
 